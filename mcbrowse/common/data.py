@@ -5,14 +5,21 @@ Extract common data from the ``daf`` repository.
 from __future__ import annotations
 
 from typing import Callable
+from typing import Dict
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
 from typing import Union
+from weakref import WeakKeyDictionary
 
+import numpy as np
+import pandas as pd  # type: ignore
 from daf import DafReader
+from daf import Vector
+from daf import as_vector
 
 __all__ = [
+    "axis_entries_index",
     "tooltips",
     "TooltipsData",
     "TooltipsEntry",
@@ -47,29 +54,69 @@ TooltipsFunction = Callable[[DafReader], Sequence[Optional[str]]]
 TooltipsData = Union[None, TooltipsEntry, Sequence[TooltipsEntry], TooltipsFunction]
 
 
-def tooltips(data: DafReader, axis: str, tooltips_data: TooltipsData = None) -> Sequence[str]:
+def tooltips(data: DafReader, axis: str, tooltips_data: TooltipsData = None) -> Vector:
     """
     Compute the ``tooltips_data`` for each entry along some ``axis`` of the ``data``.
+
+    This returns a 1D ``numpy.ndarray`` of (``object``) strings, which can be placed directly in a data frame.
     """
 
-    entries = data.axis_entries(axis)
+    entries = as_vector(data.axis_entries(axis))
     if tooltips_data is None:
-        return entries  # type: ignore
+        return entries.astype("object", copy=False)
+
+    results = np.asarray(entries).astype(str)
 
     if callable(tooltips_data):
-        return [
-            entry if tooltip is None else entry + "\n" + tooltip for entry, tooltip in zip(entries, tooltips_data(data))
-        ]
+        extras = np.asarray(tooltips_data(data), dtype="object")
+        has_extra = extras != None  # pylint: disable=singleton-comparison
+        lines = np.char.add("\n", np.where(has_extra, extras, "").astype(str))
+        return np.where(has_extra, np.char.add(results, lines), results).astype("object")
 
     if isinstance(tooltips_data, (str, tuple)):
-        tooltips_data = [tooltips_data]  # type: ignore
+        return np.char.add(results, _tooltips_lines(data, axis, tooltips_data, {})).astype("object")
 
-    results: Sequence[str] = entries  # type: ignore
+    values_by_property: Dict[str, Vector] = {}
     for tooltips_entry in tooltips_data:
-        if isinstance(tooltips_entry, str):
-            property_name = title = tooltips_entry
-        else:
-            property_name, title = tooltips_entry
-        values = data.get_vector(f"{axis};{property_name}")
-        results = [f"{prefix}\n{title}: {value}" for prefix, value in zip(results, values)]
-    return results
+        results = np.char.add(results, _tooltips_lines(data, axis, tooltips_entry, values_by_property))
+    return results.astype("object")
+
+
+def _tooltips_lines(
+    data: DafReader, axis: str, tooltips_entry: TooltipsEntry, values_by_property: Dict[str, Vector]
+) -> Vector:
+    if isinstance(tooltips_entry, str):
+        property_name = title = tooltips_entry
+    else:
+        property_name, title = tooltips_entry
+    values = values_by_property.get(property_name)
+    if values is None:
+        values = as_vector(data.get_vector(f"{axis};{property_name}")).astype(str)
+        values_by_property[property_name] = values
+    return np.char.add(f"\n{title}: ", values)
+
+
+_AXIS_ENTRIES_INDEX: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def axis_entries_index(data: DafReader, axis: str) -> pd.Index:
+    """
+    Return the entries of some ``axis`` of the ``data`` as a ``pandas.Index``.
+
+    The index is cached per ``data`` and ``axis``, so repeated calls (e.g., when collecting data for multiple figures
+    from the same ``data``) don't rebuild it, and looking up the position of entries by name (e.g., using
+    ``get_indexer``) uses a hash table which is only built once. The cached index is only reused if the ``data``
+    returns the very same entries array it was built from, so if the axis was re-created (e.g., using a ``DafWriter``),
+    the index is rebuilt.
+
+    This returns a shallow copy of the cached index (sharing its entries and hash table), so modifying it (e.g., setting
+    its ``name``) does not affect the cache.
+    """
+    entries = data.axis_entries(axis)
+    index_by_axis: Optional[Dict[str, Tuple[Vector, pd.Index]]] = _AXIS_ENTRIES_INDEX.get(data)
+    if index_by_axis is None:
+        index_by_axis = _AXIS_ENTRIES_INDEX[data] = {}
+    cached = index_by_axis.get(axis)
+    if cached is None or cached[0] is not entries:
+        cached = index_by_axis[axis] = (entries, pd.Index(entries))
+    return cached[1].copy()
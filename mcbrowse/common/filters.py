@@ -14,14 +14,18 @@ Both operations require us to select a subset of the data. Convenience functions
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 from typing import Callable
 from typing import Collection
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 import numpy as np
+import pandas as pd  # type: ignore
 from daf import Frame
 from daf import Series
 from daf import Vector
@@ -33,7 +37,11 @@ __all__ = [
     "VectorFilter",
     "vector_filter_mask",
     "TidyFilter",
+    "VectorizedTidyFilter",
+    "TidyFilterFunction",
+    "is_identity_tidy_filter",
     "tidy_filter_mask",
+    "compile_tidy_filter",
     "tidy_filter_data",
     "matrix_filter_data",
 ]
@@ -43,6 +51,13 @@ __all__ = [
 #:
 #: This is either a collection of values to keep, or a function that looks at a 1D ``numpy.ndarray`` of values and
 #: returns a boolean mask of values to keep.
+#:
+#: .. note::
+#:
+#:    The collection is converted to a ``numpy.ndarray`` once, so that membership is tested by ``numpy.isin`` using its
+#:    typed (for integers, lookup table) implementation. Passing a ``numpy.ndarray`` avoids even this conversion. For
+#:    string (or other object) vectors, membership is tested using the hash table based ``pandas.Series.isin`` instead,
+#:    as ``numpy.isin`` is very slow for these.
 VectorFilter = Union[Callable[[Vector], bool], Collection[Any]]
 
 
@@ -52,11 +67,19 @@ def vector_filter_mask(vector: Vector, filter: VectorFilter) -> Vector:  # pylin
     """
     if callable(filter):
         mask = filter(vector)
+    elif vector.dtype.kind in "OSU":
+        mask = pd.Series(vector, copy=False).isin(_filter_values(filter)).to_numpy()
     else:
-        mask = np.isin(vector, filter)
+        mask = np.isin(vector, _filter_values(filter))
     return be_vector(mask, dtype="bool")
 
 
+def _filter_values(filter: Collection[Any]) -> Vector:  # pylint: disable=redefined-builtin
+    if isinstance(filter, np.ndarray):
+        return filter
+    return np.array(list(filter))
+
+
 #: Describe how to filter some `tidy data <https://en.wikipedia.org/wiki/Tidy_data>`_ data.
 #:
 #: The key is either ``|name`` or ``&name`` identifying the data frame column to filter by, and whether to  bitwise-OR
@@ -64,8 +87,40 @@ def vector_filter_mask(vector: Vector, filter: VectorFilter) -> Vector:  # pylin
 TidyFilter = Union[Dict[str, VectorFilter]]
 
 
+@dataclass(frozen=True)
+class VectorizedTidyFilter:
+    """
+    Filter some `tidy data <https://en.wikipedia.org/wiki/Tidy_data>`_ using a function that is given the whole frame,
+    e.g. ``VectorizedTidyFilter(lambda frame: (frame["age"] > 1) & (frame["beauty"] < 2))``.
+
+    This is much faster than applying a function to each row, so it is the recommended way to write filter functions.
+    Note it must use the bitwise ``&``, ``|`` and ``~`` operators instead of the logical ``and``, ``or`` and ``not``.
+    """
+
+    #: The function to apply to the whole frame. It must return either a boolean ``pandas.Series`` with the same index
+    #: as the frame, or a boolean 1D ``numpy.ndarray`` with one entry per frame row.
+    function: Callable[[Frame], Union[Series, Vector]]
+
+
+#: Describe how to filter some `tidy data <https://en.wikipedia.org/wiki/Tidy_data>`_ data using a function.
+#:
+#: This is either a `.VectorizedTidyFilter` that is given the whole frame and returns a boolean mask, or a function
+#: that is given a single row and returns whether to keep it (see `.tidy_filter_mask`).
+TidyFilterFunction = Union[VectorizedTidyFilter, Callable[[Series], bool]]
+
+
+def is_identity_tidy_filter(filter: Union[TidyFilter, TidyFilterFunction]) -> bool:  # pylint: disable=redefined-builtin
+    """
+    Return whether the ``filter`` trivially keeps all the rows of any frame, that is, it is an empty `.TidyFilter`.
+
+    This allows skipping the work of applying such filters (e.g., ones emitted by some UI when nothing was selected).
+    Functions are never considered to be trivial, as there's no way to tell.
+    """
+    return isinstance(filter, dict) and len(filter) == 0
+
+
 def tidy_filter_mask(
-    frame: Frame, filter: Union[TidyFilter, Callable[[Series], bool]]  # pylint: disable=redefined-builtin
+    frame: Frame, filter: Union[TidyFilter, TidyFilterFunction]  # pylint: disable=redefined-builtin
 ) -> Vector:
     """
     Return a boolean 1D ``numpy.ndarray`` mask specifying which rows of the `tidy
@@ -76,28 +131,72 @@ def tidy_filter_mask(
 
     If the ``filter`` is a dictionary, it species filters to apply independently to each column. The key should start
     with either ``|`` or ``&``; the final mask would bitwise-OR all the column masks that started with ``|``, and then
-    bitwise-AND the result with the column masks that started with ``&``.
+    bitwise-AND the result with the column masks that started with ``&``. If a column is categorical, and the filter is
+    a collection of values, it is applied to the (integer) category codes. The ``&`` column masks are computed first, so
+    if they reject all the rows, the rest of the columns are not even looked at. Similarly, once the ``|`` column masks
+    accept all the rows, the rest of them are skipped.
 
-    If the ``filter`` is a function, it is applied to each row of the frame and the results are collected as the mask.
+    If the ``filter`` is a `.VectorizedTidyFilter`, its function is applied to the whole frame and its result is used as
+    the mask. This is much faster than the alternative of using a function that is applied to each row of the frame,
+    collecting the results as the mask.
     """
-    if not isinstance(filter, dict):
-        return as_vector(be_series(frame.apply(filter, axis=1), dtype="bool"))
+    if isinstance(filter, dict):
+        filter = compile_tidy_filter(filter)
 
-    and_mask: Optional[Vector] = None
-    or_mask: Optional[Vector] = None
+    if isinstance(filter, VectorizedTidyFilter):
+        return _vectorized_filter_mask(frame, filter)
+
+    return as_vector(be_series(frame.apply(filter, axis=1), dtype="bool"))
 
+
+def compile_tidy_filter(filter: TidyFilter) -> VectorizedTidyFilter:  # pylint: disable=redefined-builtin
+    """
+    Compile a `.TidyFilter` into a `.VectorizedTidyFilter` that, given a frame, returns the same mask as
+    `.tidy_filter_mask`.
+
+    This parses the ``filter`` (and converts any collections of values to ``numpy.ndarray``) only once, so it is
+    worthwhile when the same filter is applied to many frames. The result can be passed as the ``filter`` to
+    `.tidy_filter_mask`, `.tidy_filter_data`, or to the figure data methods.
+    """
+    and_filters: List[Tuple[str, VectorFilter]] = []
+    or_filters: List[Tuple[str, VectorFilter]] = []
     for name, name_filter in filter.items():
         assert name.startswith("|") or name.startswith("&")
-        name_mask = vector_filter_mask(as_vector(frame[name[1:]]), name_filter)
+        if not callable(name_filter):
+            name_filter = _filter_values(name_filter)
+        if name.startswith("&"):
+            and_filters.append((name[1:], name_filter))
+        else:
+            or_filters.append((name[1:], name_filter))
+
+    def compiled_filter(frame: Frame) -> Vector:
+        return _tidy_filter_mask(frame, and_filters, or_filters)
 
-        if name.startswith("|"):
-            if or_mask is None:
-                or_mask = be_vector(np.zeros(frame.shape[0], dtype="bool"))
-            or_mask |= name_mask  # type: ignore
+    return VectorizedTidyFilter(compiled_filter)
+
+
+def _tidy_filter_mask(
+    frame: Frame, and_filters: List[Tuple[str, VectorFilter]], or_filters: List[Tuple[str, VectorFilter]]
+) -> Vector:
+    and_mask: Optional[Vector] = None
+    for name, name_filter in and_filters:
+        name_mask = _column_filter_mask(frame[name], name_filter)
+        if and_mask is None:
+            and_mask = name_mask.copy()
         else:
-            if and_mask is None:
-                and_mask = be_vector(np.full(frame.shape[0], True, dtype="bool"))
-            and_mask &= name_mask  # type: ignore
+            np.logical_and(and_mask, name_mask, out=and_mask)
+        if not np.any(and_mask):
+            return and_mask
+
+    or_mask: Optional[Vector] = None
+    for name, name_filter in or_filters:
+        name_mask = _column_filter_mask(frame[name], name_filter)
+        if or_mask is None:
+            or_mask = name_mask.copy()
+        else:
+            np.logical_or(or_mask, name_mask, out=or_mask)
+        if np.all(or_mask):
+            break
 
     if or_mask is None:
         if and_mask is None:
@@ -106,17 +205,43 @@ def tidy_filter_mask(
 
     if and_mask is None:
         return or_mask
-    and_mask &= or_mask  # type: ignore
+    np.logical_and(and_mask, or_mask, out=and_mask)
     return and_mask
 
 
+def _column_filter_mask(column: Series, filter: VectorFilter) -> Vector:  # pylint: disable=redefined-builtin
+    if not callable(filter) and isinstance(column.dtype, pd.CategoricalDtype):
+        return be_vector(column.isin(filter).to_numpy(), dtype="bool")
+    return vector_filter_mask(as_vector(column), filter)
+
+
+def _vectorized_filter_mask(frame: Frame, filter: VectorizedTidyFilter) -> Vector:  # pylint: disable=redefined-builtin
+    mask = filter.function(frame)
+    if isinstance(mask, pd.Series):
+        assert mask.index.equals(frame.index), "vectorized tidy filter returned a series with a different index"
+        mask = as_vector(mask)
+    assert isinstance(mask, np.ndarray), f"vectorized tidy filter returned a: {type(mask)}"
+    assert mask.shape == (frame.shape[0],), f"vectorized tidy filter returned a mask of shape: {mask.shape}"
+    return be_vector(mask, dtype="bool")
+
+
 def tidy_filter_data(
-    frame: Frame, filter: Union[TidyFilter, Callable[[Series], bool]]  # pylint: disable=redefined-builtin
+    frame: Frame, filter: Union[TidyFilter, TidyFilterFunction]  # pylint: disable=redefined-builtin
 ) -> Frame:
     """
     Similar to `.tidy_filter_mask` but return just the rows of the ``frame`` that were kept by the ``filter``.
+
+    If all the rows were kept, this returns the original ``frame`` rather than a copy. If none of them were kept, this
+    returns an empty slice of it.
     """
-    return frame.iloc[tidy_filter_mask(frame, filter), :]
+    if is_identity_tidy_filter(filter):
+        return frame
+    mask = tidy_filter_mask(frame, filter)
+    if np.all(mask):
+        return frame
+    if not np.any(mask):
+        return frame.iloc[0:0, :]
+    return frame.take(np.flatnonzero(mask), axis=0)
 
 
 def matrix_filter_data(
@@ -125,13 +250,17 @@ def matrix_filter_data(
     """
     Apply the ``rows_filter`` to the ``frame`` index and the ``columns_filter`` to its columns, and return a new frame
     containing just the rows and columns that were kept by the filter(s).
+
+    If all the rows and columns were kept, this returns the original ``frame`` rather than a copy.
     """
     if rows_filter is not None:
-        rows_mask = vector_filter_mask(as_vector(frame.index), rows_filter)
-        frame = frame.iloc[rows_mask, :]
+        rows_indices = np.flatnonzero(vector_filter_mask(as_vector(frame.index), rows_filter))
+        if rows_indices.size < frame.shape[0]:
+            frame = frame.take(rows_indices, axis=0)
 
     if columns_filter is not None:
-        columns_mask = vector_filter_mask(as_vector(frame.columns), columns_filter)
-        frame = frame.iloc[:, columns_mask]
+        columns_indices = np.flatnonzero(vector_filter_mask(as_vector(frame.columns), columns_filter))
+        if columns_indices.size < frame.shape[1]:
+            frame = frame.take(columns_indices, axis=1)
 
     return frame
@@ -9,6 +9,9 @@ For simplicity **all** sizes are specified in "points" (72 points to the inch).
 specifying the overall width and height of figures, but having consistent size for **everything** is a huge
 simplification.
 
+All the veneer objects are immutable (frozen data classes). To tweak a veneer, use ``dataclasses.replace`` to create a
+modified copy of it.
+
 .. note::
 
     The veneers defined here and in ``mcbrowse`` in general and a small subset of what is possible to achieve using
@@ -19,7 +22,9 @@ simplification.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 from typing import Mapping
 from typing import Optional
@@ -27,7 +32,12 @@ from typing import Sequence
 from typing import Tuple
 from typing import Union
 
+import numpy as np
+import pandas as pd  # type: ignore
+from daf import Frame
 from daf import Series
+from daf import Vector
+from daf import as_vector
 
 __all__ = [
     "FigureVeneer",
@@ -36,15 +46,22 @@ __all__ = [
     "ContinuousAxisVeneer",
     "DiscreteColorScale",
     "PointsVeneer",
+    "PointsVeneerResolved",
+    "resolve_points_veneer",
     "RegionVeneer",
+    "RegionVeneerResolved",
+    "resolve_region_veneer",
     "LinesVeneer",
+    "LinesVeneerResolved",
+    "resolve_lines_veneer",
     "ContinuousColorScale",
     "STANDARD_COLORS",
     "color_rgb",
+    "color_rgb_vector",
 ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class FigureVeneer:
     """
     Common parameters controlling the figure as a whole.
@@ -64,7 +81,7 @@ class FigureVeneer:
     title_font_size: Optional[float] = 18
 
 
-@dataclass
+@dataclass(frozen=True)
 class TooltipsVeneer:
     """
     Common parameters controlling the appearance of tooltips.
@@ -93,7 +110,7 @@ class TooltipsVeneer:
     transparency: float = 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class DiscreteAxisVeneer:
     """
     Common parameters controlling how a discrete axis is formatted.
@@ -106,7 +123,7 @@ class DiscreteAxisVeneer:
     label_font_size: Optional[float] = 12
 
 
-@dataclass
+@dataclass(frozen=True)
 class ContinuousAxisVeneer:
     """
     Common parameters controlling how a continuous axis is formatted.
@@ -145,7 +162,7 @@ class ContinuousAxisVeneer:
 DiscreteColorScale = Union[Mapping[Any, str], Series]
 
 
-@dataclass
+@dataclass(frozen=True)
 class ContinuousColorScale:
     """
     How to color a continuous value.
@@ -203,10 +220,7 @@ class ContinuousColorScale:
     max_value: Optional[float] = None
 
 
-#: Standard web colors from `Wikipedia <https://en.wikipedia.org/wiki/Web_colors>`_.
-#:
-#: All names are in lower case.
-STANDARD_COLORS = dict(
+_STANDARD_COLORS = dict(
     aliceblue="#f0f8ff",
     antiquewhite="#faebd7",
     aqua="#00ffff",
@@ -348,6 +362,12 @@ STANDARD_COLORS = dict(
     yellow="#ffff00",
     yellowgreen="#9acd32",
 )
+_STANDARD_COLORS = {name: sys.intern(rgb) for name, rgb in _STANDARD_COLORS.items()}
+
+#: Standard web colors from `Wikipedia <https://en.wikipedia.org/wiki/Web_colors>`_.
+#:
+#: All names are in lower case. This is a read-only mapping.
+STANDARD_COLORS: Mapping[str, str] = MappingProxyType(_STANDARD_COLORS)
 
 
 def color_rgb(color: str) -> str:
@@ -358,12 +378,26 @@ def color_rgb(color: str) -> str:
     """
     if color.startswith("#"):
         return color
-    color = color.lower()
-    assert color in STANDARD_COLORS, f"unknown color: {color}"
-    return STANDARD_COLORS[color]
+    rgb = _STANDARD_COLORS.get(color) or _STANDARD_COLORS.get(color.lower())
+    assert rgb is not None, f"unknown color: {color}"
+    return rgb
 
 
-@dataclass
+def color_rgb_vector(colors: Union[Sequence[str], Series]) -> Vector:
+    """
+    Convert a sequence of color names to a 1D ``numpy.ndarray`` of ``#rrggbb`` colors (see `.color_rgb`).
+
+    This is meant for frame columns containing colors, and is much faster than calling `.color_rgb` for each one.
+    """
+    names = pd.Series(np.asarray(colors, dtype="object"), dtype="string")
+    is_rgb = names.str.startswith("#")
+    rgbs = names.where(is_rgb, names.str.lower().map(_STANDARD_COLORS))
+    is_unknown = rgbs.isna()
+    assert not is_unknown.any(), f"unknown color: {names[is_unknown].iloc[0]}"
+    return rgbs.to_numpy(dtype="object")
+
+
+@dataclass(frozen=True)
 class PointsVeneer:
     """
     How to display points (e.g. in a scatter plot or a UMAP 2D projection).
@@ -397,7 +431,7 @@ class PointsVeneer:
     transparency: Union[float, str] = 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class RegionVeneer:
     """
     How to display filled regions (e.g. in a bar plot).
@@ -416,7 +450,7 @@ class RegionVeneer:
     border_color: Optional[str] = "black"
 
 
-@dataclass
+@dataclass(frozen=True)
 class LinesVeneer:
     """
     How to display lines (e.g. edges of the KNN graph in a UMAP projection).
@@ -433,3 +467,118 @@ class LinesVeneer:
     #: The transparency of the lines (0 - fully opaque, 1 - fully transparent). If this is a string, it is the name of a
     #: frame column containing the transparency.
     transparency: Union[float, str] = 0
+
+
+@dataclass(frozen=True)
+class PointsVeneerResolved:
+    """
+    A `.PointsVeneer` resolved for a specific frame (see `.resolve_points_veneer`).
+
+    Each field that may refer to a frame column is a 1D ``numpy.ndarray`` with one entry per frame row, so plotting code
+    does not need to distinguish between fixed values and column names.
+    """
+
+    #: The shape of the points.
+    shape: str
+
+    #: The diameter of each point.
+    fill_diameter: Vector
+
+    #: The ``#rrggbb`` fill color of each point.
+    fill_color: Vector
+
+    #: The border width of each point, or ``None`` if no border will be drawn.
+    border_width: Optional[Vector]
+
+    #: The ``#rrggbb`` border color of each point, or ``None`` if no border will be drawn.
+    border_color: Optional[Vector]
+
+    #: The transparency of each point.
+    transparency: Vector
+
+
+def resolve_points_veneer(veneer: PointsVeneer, frame: Frame) -> PointsVeneerResolved:
+    """
+    Resolve a points ``veneer`` for a specific ``frame``, fetching any referenced columns (and converting colors to
+    ``#rrggbb``) once.
+    """
+    return PointsVeneerResolved(
+        shape=veneer.shape,
+        fill_diameter=_resolve_numbers(veneer.fill_diameter, frame),
+        fill_color=_resolve_colors(veneer.fill_color, frame),
+        border_width=None if veneer.border_width is None else _resolve_numbers(veneer.border_width, frame),
+        border_color=None if veneer.border_color is None else _resolve_colors(veneer.border_color, frame),
+        transparency=_resolve_numbers(veneer.transparency, frame),
+    )
+
+
+@dataclass(frozen=True)
+class RegionVeneerResolved:
+    """
+    A `.RegionVeneer` resolved for a specific frame (see `.resolve_region_veneer`).
+
+    Each field that may refer to a frame column is a 1D ``numpy.ndarray`` with one entry per frame row.
+    """
+
+    #: The ``#rrggbb`` fill color of each region.
+    fill_color: Vector
+
+    #: The border width of each region, or ``None`` if no border will be drawn.
+    border_width: Optional[Vector]
+
+    #: The ``#rrggbb`` border color of each region, or ``None`` if no border will be drawn.
+    border_color: Optional[Vector]
+
+
+def resolve_region_veneer(veneer: RegionVeneer, frame: Frame) -> RegionVeneerResolved:
+    """
+    Resolve a region ``veneer`` for a specific ``frame``, fetching any referenced columns (and converting colors to
+    ``#rrggbb``) once.
+    """
+    return RegionVeneerResolved(
+        fill_color=_resolve_colors(veneer.fill_color, frame),
+        border_width=None if veneer.border_width is None else _resolve_numbers(veneer.border_width, frame),
+        border_color=None if veneer.border_color is None else _resolve_colors(veneer.border_color, frame),
+    )
+
+
+@dataclass(frozen=True)
+class LinesVeneerResolved:
+    """
+    A `.LinesVeneer` resolved for a specific frame (see `.resolve_lines_veneer`).
+
+    Each field that may refer to a frame column is a 1D ``numpy.ndarray`` with one entry per frame row.
+    """
+
+    #: The width of each line, or ``None`` if no lines will be drawn.
+    width: Optional[Vector]
+
+    #: The ``#rrggbb`` color of each line, or ``None`` if no lines will be drawn.
+    color: Optional[Vector]
+
+    #: The transparency of each line.
+    transparency: Vector
+
+
+def resolve_lines_veneer(veneer: LinesVeneer, frame: Frame) -> LinesVeneerResolved:
+    """
+    Resolve a lines ``veneer`` for a specific ``frame``, fetching any referenced columns (and converting colors to
+    ``#rrggbb``) once.
+    """
+    return LinesVeneerResolved(
+        width=None if veneer.width is None else _resolve_numbers(veneer.width, frame),
+        color=None if veneer.color is None else _resolve_colors(veneer.color, frame),
+        transparency=_resolve_numbers(veneer.transparency, frame),
+    )
+
+
+def _resolve_numbers(value: Union[float, str], frame: Frame) -> Vector:
+    if isinstance(value, str):
+        return as_vector(frame[value]).astype("float64", copy=False)
+    return np.full(frame.shape[0], value, dtype="float64")
+
+
+def _resolve_colors(color: str, frame: Frame) -> Vector:
+    if color in frame.columns:
+        return color_rgb_vector(frame[color])
+    return np.full(frame.shape[0], color_rgb(color), dtype="object")
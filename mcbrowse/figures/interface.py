@@ -14,28 +14,36 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from dataclasses import dataclass
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Generic
+from typing import Mapping
 from typing import Optional
 from typing import Sequence
 from typing import TypeVar
 from typing import Union
 
 import numpy as np
+import pandas as pd  # type: ignore
 from daf import DafReader
 from daf import Frame
 from daf import Series
+from daf import Vector
 from plotly.basedatatypes import BaseFigure  # type: ignore
 
 from ..common import TidyFilter
+from ..common import TidyFilterFunction
 from ..common import VectorFilter
-from ..common import tidy_filter_data
+from ..common import VectorizedTidyOrder
+from ..common import compile_tidy_filter
+from ..common import is_identity_tidy_filter
 from ..common import tidy_filter_mask
-from ..common import tidy_randomize
+from ..common import tidy_random_indices
 from ..common import tidy_sort_by
 
-__all__ = ["FigureFilter", "FigureData", "TidyFigureData", "HeatmapData", "FigureVeneer"]
+__all__ = ["FigureNeeds", "FigureFilter", "FigureData", "TidyColumns", "TidyFigureData", "HeatmapData", "FigureVeneer"]
 
 
 class FigureData(ABC):
@@ -50,7 +58,7 @@ class FigureData(ABC):
     @abstractmethod
     def filter(
         self,
-        filter: Union[TidyFilter, Callable[[Series], bool]],  # pylint: disable=redefined-builtin
+        filter: Union[TidyFilter, TidyFilterFunction],  # pylint: disable=redefined-builtin
     ) -> None:
         """
         Filter the contained data using `.tidy_filter_data`.
@@ -64,7 +72,7 @@ class FigureData(ABC):
     @abstractmethod
     def highlight(
         self,
-        filter: Union[TidyFilter, Callable[[Series], bool]],  # pylint: disable=redefined-builtin
+        filter: Union[TidyFilter, TidyFilterFunction],  # pylint: disable=redefined-builtin
     ) -> None:
         """
         Mark everything matching the ``filter`` as "highlighted" using `.tidy_filter_mask`. This will trigger using a
@@ -78,7 +86,7 @@ class FigureData(ABC):
         """
 
     @abstractmethod
-    def sort(self, order: Union[Callable[[Series], Any], Sequence[str]]) -> None:
+    def sort(self, order: Union[VectorizedTidyOrder, Callable[[Series], Any], Sequence[str]]) -> None:
         """
         Sort the contained data using `.tidy_sort_by`.
 
@@ -126,66 +134,206 @@ AnyData = Union[FigureData, HeatmapData]
 AnyDataT = TypeVar("AnyDataT", bound=AnyData)
 
 
+class TidyColumns:
+    """
+    Store (part of) the data of a `.TidyFigureData` as a struct of arrays, that is, a separate 1D array per column, all
+    of the same size, and a separate index array.
+
+    Selecting or reordering rows gathers each array directly, and the ``pandas.DataFrame`` is only constructed (without
+    copying the arrays) if and when it is actually needed. Once it was constructed, the data frame is the source of
+    truth for the data, so any changes made to it (e.g., adding a column) are preserved.
+    """
+
+    def __init__(self, columns: Mapping[str, Any], index: Union[Vector, pd.Index]) -> None:
+        self._columns: Dict[str, Any] = {name: _column_array(values) for name, values in columns.items()}
+        self._index = index
+        self._frame: Optional[Frame] = None
+
+    @staticmethod
+    def from_frame(frame: Frame) -> TidyColumns:
+        """
+        Create the columns for the data of a tidy ``frame``.
+        """
+        columns = TidyColumns({name: frame[name] for name in frame.columns}, frame.index)
+        columns._frame = frame  # pylint: disable=protected-access
+        return columns
+
+    @property
+    def columns(self) -> Dict[str, Any]:
+        """
+        The 1D array of values of each column. This is typically a ``numpy.ndarray``, but may also be a ``pandas``
+        extension array (e.g., ``pandas.Categorical``). A ``pandas.Series`` is converted to its (unaligned) array of
+        values, and any other sequence is converted to a ``numpy.ndarray``.
+        """
+        if self._frame is None:
+            return self._columns
+        return {name: _column_array(self._frame[name]) for name in self._frame.columns}
+
+    @property
+    def index(self) -> Union[Vector, pd.Index]:
+        """
+        The index (name) of each row. This is either a ``numpy.ndarray`` or a ``pandas.Index``.
+        """
+        if self._frame is None:
+            return self._index
+        return self._frame.index
+
+    @property
+    def size(self) -> int:
+        """
+        The number of rows.
+        """
+        return len(self.index)
+
+    @property
+    def frame(self) -> Frame:
+        """
+        The data as a tidy ``pandas.DataFrame``.
+        """
+        if self._frame is None:
+            # With ``copy=False`` each column becomes its own block wrapping the original array, instead of being copied
+            # into a consolidated block per dtype.
+            self._frame = pd.DataFrame(self._columns, index=self._index, copy=False)
+        return self._frame
+
+    def take(self, indices: Vector) -> TidyColumns:
+        """
+        Return the columns of just the rows at the specified ``indices`` positions.
+        """
+        return TidyColumns({name: values[indices] for name, values in self.columns.items()}, self.index[indices])
+
+    def select(self, mask: Vector) -> Optional[TidyColumns]:
+        """
+        Return the columns of just the rows specified by the boolean ``mask``, or ``None`` if no rows were selected.
+        """
+        selected_count = np.count_nonzero(mask)
+        if selected_count == 0:
+            return None
+        if selected_count == self.size:
+            return self
+        return self.take(np.flatnonzero(mask))
+
+
+def _column_array(values: Any) -> Any:
+    if isinstance(values, pd.Series):
+        values = values.to_numpy() if isinstance(values.dtype, np.dtype) else values.array
+    if isinstance(values, (np.ndarray, pd.api.extensions.ExtensionArray)):
+        return values
+    return np.asarray(values)
+
+
 class TidyFigureData(FigureData):
     """
-    Implement `.FigureData` for the very common case of a tidy ``pandas.DataFrame``.
+    Implement `.FigureData` for the very common case of tidy data (e.g. a ``pandas.DataFrame``).
+
+    The data is stored as `.TidyColumns`, so it can be given either as a tidy ``pandas.DataFrame``, or as a mapping
+    from each column name to a 1D array of its values, together with an ``index`` array. The latter avoids the cost
+    of constructing the data frame unless it is actually used.
     """
 
-    def __init__(self, tidy: Frame) -> None:
-        #: The tidy data frame containing the figures data.
-        #:
-        #: If we are highlighting, this will only contain the "normal" (non-highlighted) data.
-        #:
-        #: If all the data is highlighted, this will be ``None``.
-        self.tidy: Optional[Frame] = tidy
+    def __init__(self, tidy: Union[Frame, Mapping[str, Any]], *, index: Union[None, Vector, pd.Index] = None) -> None:
+        self._tidy: Optional[TidyColumns]
+        if isinstance(tidy, pd.DataFrame):
+            assert index is None
+            self._tidy = TidyColumns.from_frame(tidy)
+        else:
+            if index is None:
+                index = np.arange(len(next(iter(tidy.values()), ())))
+            self._tidy = TidyColumns(tidy, index)
+
+        self._highlighted: Optional[TidyColumns] = None
+
+    @property
+    def tidy(self) -> Optional[Frame]:
+        """
+        The tidy data frame containing the figures data.
+
+        If we are highlighting, this will only contain the "normal" (non-highlighted) data.
+
+        If all the data is highlighted, this will be ``None``.
+        """
+        return None if self._tidy is None else self._tidy.frame
+
+    @tidy.setter
+    def tidy(self, tidy: Optional[Frame]) -> None:
+        self._tidy = None if tidy is None else TidyColumns.from_frame(tidy)
 
-        #: If we are highlighting, this will only contain the highlighted data.
-        self.highlighted: Optional[Frame] = None
+    @property
+    def highlighted(self) -> Optional[Frame]:
+        """
+        If we are highlighting, this will only contain the highlighted data.
+        """
+        return None if self._highlighted is None else self._highlighted.frame
+
+    @highlighted.setter
+    def highlighted(self, highlighted: Optional[Frame]) -> None:
+        self._highlighted = None if highlighted is None else TidyColumns.from_frame(highlighted)
 
     def filter(
         self,
-        filter: Union[TidyFilter, Callable[[Series], bool]],  # pylint: disable=redefined-builtin
+        filter: Union[TidyFilter, TidyFilterFunction],  # pylint: disable=redefined-builtin
     ) -> None:
-        if self.tidy is not None:
-            self.tidy = tidy_filter_data(self.tidy, filter)
-            if self.tidy.shape[0] == 0:
-                self.tidy = None
+        if is_identity_tidy_filter(filter):
+            return
+
+        if isinstance(filter, dict) and self._tidy is not None and self._highlighted is not None:
+            filter = compile_tidy_filter(filter)
 
-        if self.highlighted is not None:
-            self.highlighted = tidy_filter_data(self.highlighted, filter)
-            if self.highlighted.shape[0] == 0:
-                self.highlighted = None
+        if self._tidy is not None:
+            self._tidy = self._tidy.select(tidy_filter_mask(self._tidy.frame, filter))
+
+        if self._highlighted is not None:
+            self._highlighted = self._highlighted.select(tidy_filter_mask(self._highlighted.frame, filter))
 
     def highlight(
         self,
-        filter: Union[TidyFilter, Callable[[Series], bool]],  # pylint: disable=redefined-builtin
+        filter: Union[TidyFilter, TidyFilterFunction],  # pylint: disable=redefined-builtin
     ) -> None:
-        assert self.highlighted is None, "repeated calls to FigureData.highlight"
-        assert self.tidy is not None
+        assert self._highlighted is None, "repeated calls to FigureData.highlight"
+        assert self._tidy is not None
 
-        highlighted_mask = tidy_filter_mask(self.tidy, filter)
-        if not np.any(highlighted_mask):
+        highlighted_mask = tidy_filter_mask(self._tidy.frame, filter)
+        highlighted_count = np.count_nonzero(highlighted_mask)
+        if highlighted_count == 0:
             return
 
-        if np.all(highlighted_mask):
-            self.highlighted = self.tidy
-            self.tidy = None
+        if highlighted_count == self._tidy.size:
+            self._highlighted = self._tidy
+            self._tidy = None
             return
 
-        self.highlighted = self.tidy.iloc[highlighted_mask, :]
-        self.tidy = self.tidy.iloc[~highlighted_mask, :]
+        self._highlighted = self._tidy.take(np.flatnonzero(highlighted_mask))
+        self._tidy = self._tidy.take(np.flatnonzero(~highlighted_mask))
 
-    def sort(self, order: Union[Callable[[Series], Any], Sequence[str]]) -> None:
-        if self.tidy is not None:
-            self.tidy = tidy_sort_by(self.tidy, order)
-        if self.highlighted is not None:
-            self.highlighted = tidy_sort_by(self.highlighted, order)
+    def sort(self, order: Union[VectorizedTidyOrder, Callable[[Series], Any], Sequence[str]]) -> None:
+        if self._tidy is not None:
+            self.tidy = tidy_sort_by(self._tidy.frame, order)
+        if self._highlighted is not None:
+            self.highlighted = tidy_sort_by(self._highlighted.frame, order)
 
     def randomize(self, random_seed: Optional[int] = None) -> None:
-        if self.tidy is not None:
-            self.tidy = tidy_randomize(self.tidy, random_seed=random_seed)
-        if self.highlighted is not None:
-            self.highlighted = tidy_randomize(self.highlighted, random_seed=random_seed)
+        if self._tidy is not None:
+            self._tidy = self._tidy.take(tidy_random_indices(self._tidy.size, random_seed=random_seed))
+        if self._highlighted is not None:
+            self._highlighted = self._highlighted.take(
+                tidy_random_indices(self._highlighted.size, random_seed=random_seed)
+            )
+
+
+@dataclass(frozen=True)
+class FigureNeeds:
+    """
+    Which of the optional parts of the `.FigureData` will actually be used by the `.FigureVeneer`.
+
+    This is computed by `.FigureVeneer.needs` and passed to `.FigureFilter.collect`, which can then skip fetching (and
+    computing) data that will never be shown.
+    """
+
+    #: Whether the value of each data point (used for coloring it) is needed.
+    values: bool = True
+
+    #: Whether the tooltip of each data point is needed.
+    tooltips: bool = True
 
 
 class FigureFilter(ABC, Generic[AnyDataT]):  # pylint: disable=too-few-public-methods
@@ -198,9 +346,12 @@ class FigureFilter(ABC, Generic[AnyDataT]):  # pylint: disable=too-few-public-me
     """
 
     @abstractmethod
-    def collect(self, data: DafReader) -> AnyDataT:
+    def collect(self, data: DafReader, needs: Optional[FigureNeeds] = None) -> AnyDataT:
         """
         Collect the matching `.FigureData` out of the ``data``.
+
+        If ``needs`` is specified, only the parts of the data needed by the `.FigureVeneer` are collected. By default,
+        everything is collected.
         """
 
 
@@ -213,6 +364,14 @@ class FigureVeneer(ABC, Generic[AnyDataT]):  # pylint: disable=too-few-public-me
         Have each `.FigureVeneer` expose a ``plotly`` widget that configures it.
     """
 
+    def needs(self) -> FigureNeeds:
+        """
+        Return which optional parts of the `.FigureData` are needed to plot the figure.
+
+        By default, everything is needed.
+        """
+        return FigureNeeds()
+
     @abstractmethod
     def plot(self, data: AnyDataT) -> BaseFigure:
         """
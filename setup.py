@@ -1,8 +1,6 @@
 #!/usr/bin/env python
 
-import os
-import platform
-from setuptools import Extension, setup, find_packages
+from setuptools import setup, find_packages
 
 with open("README.rst") as readme_file:
     readme = readme_file.read()
@@ -10,9 +8,15 @@ with open("README.rst") as readme_file:
 with open("HISTORY.rst") as history_file:
     history = history_file.read()
 
-requirements = open("requirements.txt").read().split()
-test_requirements = open("requirements_test.txt").read().split()
-dev_requirements = open("requirements_dev.txt").read().split()
+
+def _read(path):
+    with open(path) as file:
+        return file.read().split()
+
+
+requirements = _read("requirements.txt")
+test_requirements = _read("requirements_test.txt")
+dev_requirements = _read("requirements_dev.txt")
 
 setup(
     author="Oren Ben-Kiki",
@@ -40,7 +44,7 @@ setup(
     include_package_data=True,
     keywords="mcbrowse",
     name="mcbrowse",
-    packages=find_packages(include=["mcbrowse"]),
+    packages=find_packages(include=["mcbrowse", "mcbrowse.*"]),
     test_suite="tests",
     tests_require=test_requirements,
     extras_require={"dev": dev_requirements},
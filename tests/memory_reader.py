@@ -0,0 +1,56 @@
+"""
+A minimal in-memory stand-in for a ``daf.DafReader``, providing just the (read-only) operations used by ``mcbrowse``.
+"""
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import cast
+
+import numpy as np
+from daf import DafReader
+
+# pylint: disable=missing-function-docstring
+
+
+class MemoryReader:
+    """
+    Hold some axes, vectors and matrices in memory, and record the names of the fetched vectors.
+    """
+
+    def __init__(
+        self,
+        axes: Dict[str, Sequence[str]],
+        vectors: Optional[Dict[str, Sequence[Any]]] = None,
+        matrices: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.axes = {axis: np.array(entries) for axis, entries in axes.items()}
+        self.vectors = {name: np.array(vector) for name, vector in (vectors or {}).items()}
+        self.matrices = {name: np.array(matrix) for name, matrix in (matrices or {}).items()}
+        self.fetched: List[str] = []
+
+    def axis_entries(self, axis: str) -> np.ndarray:
+        return self.axes[axis]
+
+    def get_vector(self, name: str) -> np.ndarray:
+        self.fetched.append(name)
+        vector = self.vectors.get(name)
+        if vector is not None:
+            return vector
+
+        axes, property_name = name.split(";")
+        rows_axis, column = axes.split(",")
+        columns_axis, entry = column.split("=")
+        position = list(self.axes[columns_axis]).index(entry)
+        matrix = self.matrices.get(f"{rows_axis},{columns_axis};{property_name}")
+        if matrix is not None:
+            return matrix[:, position]
+        return self.matrices[f"{columns_axis},{rows_axis};{property_name}"][position, :]
+
+    def as_daf(self) -> DafReader:
+        """
+        Return this reader typed as a ``daf.DafReader``, for passing to the functions expecting one.
+        """
+        return cast(DafReader, self)
@@ -0,0 +1,19 @@
+"""
+Test the ``mcbrowse.common`` module.
+"""
+
+import mcbrowse
+import mcbrowse.common
+from mcbrowse.common import data
+from mcbrowse.common import filters
+from mcbrowse.common import reorders
+from mcbrowse.common import veneers
+
+# pylint: disable=missing-function-docstring
+
+
+def test_reexported_names() -> None:
+    for sub_module in (data, filters, reorders, veneers):
+        for name in sub_module.__all__:
+            assert getattr(mcbrowse.common, name) is getattr(sub_module, name)
+            assert getattr(mcbrowse, name) is getattr(sub_module, name)
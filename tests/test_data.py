@@ -0,0 +1,63 @@
+"""
+Test the ``mcbrowse.common.data`` module.
+"""
+
+import numpy as np
+
+from mcbrowse.common.data import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+from .memory_reader import MemoryReader
+
+# pylint: disable=missing-function-docstring
+
+
+def _reader() -> MemoryReader:
+    return MemoryReader(
+        axes=dict(metacell=["M1", "M2", "M3"], gene=["FOXP1", "CD8A"]),
+        vectors={"metacell;type": ["T", "B", "T"], "metacell;age": [1, 2.5, np.nan]},
+    )
+
+
+def test_tooltips_none() -> None:
+    results = tooltips(_reader().as_daf(), "metacell")
+    assert results.dtype == "object"
+    assert list(results) == ["M1", "M2", "M3"]
+
+
+def test_tooltips_entry() -> None:
+    results = tooltips(_reader().as_daf(), "metacell", "type")
+    assert results.dtype == "object"
+    assert list(results) == ["M1\ntype: T", "M2\ntype: B", "M3\ntype: T"]
+
+    results = tooltips(_reader().as_daf(), "metacell", ("type", "Type"))
+    assert list(results) == ["M1\nType: T", "M2\nType: B", "M3\nType: T"]
+
+
+def test_tooltips_entries() -> None:
+    reader = _reader()
+    results = tooltips(reader.as_daf(), "metacell", ["type", ("type", "Kind"), "age"])
+    assert results.dtype == "object"
+    assert list(results) == [
+        "M1\ntype: T\nKind: T\nage: 1.0",
+        "M2\ntype: B\nKind: B\nage: 2.5",
+        "M3\ntype: T\nKind: T\nage: nan",
+    ]
+    assert reader.fetched == ["metacell;type", "metacell;age"]
+
+
+def test_tooltips_function() -> None:
+    results = tooltips(_reader().as_daf(), "metacell", lambda data: [None, "Note: odd", None])
+    assert results.dtype == "object"
+    assert list(results) == ["M1", "M2\nNote: odd", "M3"]
+
+
+def test_axis_entries_index() -> None:
+    reader = _reader()
+    index = axis_entries_index(reader.as_daf(), "gene")
+    assert list(index) == ["FOXP1", "CD8A"]
+
+    index.name = "renamed"
+    assert axis_entries_index(reader.as_daf(), "gene").name is None
+
+    reader.axes["gene"] = np.array(["CD4", "CD8A"])
+    assert list(axis_entries_index(reader.as_daf(), "gene")) == ["CD4", "CD8A"]
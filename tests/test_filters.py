@@ -15,6 +15,17 @@ def test_vector_filter_mask() -> None:
     data = be_vector(np.array([0, 1, 2, 3]))
     assert np.all(vector_filter_mask(data, lambda values: values % 2 == 0) == np.array([True, False, True, False]))
     assert np.all(vector_filter_mask(data, [1, 2]) == np.array([False, True, True, False]))
+    assert np.all(vector_filter_mask(data, {1, 2}) == np.array([False, True, True, False]))
+    assert np.all(vector_filter_mask(data, range(1, 100)) == np.array([False, True, True, True]))
+
+    names = be_vector(np.array(["a", "b", "c", "d"], dtype="object"))
+    assert np.all(vector_filter_mask(names, {"b", "c", "e"}) == np.array([False, True, True, False]))
+
+
+def test_is_identity_tidy_filter() -> None:
+    assert is_identity_tidy_filter({})
+    assert not is_identity_tidy_filter({"|age": [0]})
+    assert not is_identity_tidy_filter(lambda series: True)
 
 
 def test_tidy_filter_mask() -> None:
@@ -22,6 +33,12 @@ def test_tidy_filter_mask() -> None:
     mask = tidy_filter_mask(tidy, lambda series: series["age"] == series["beauty"])
     assert np.all(mask == np.array([True, False, False, True]))
 
+    mask = tidy_filter_mask(tidy, VectorizedTidyFilter(lambda frame: (frame["age"] == 1) | (frame["beauty"] == 1)))
+    assert np.all(mask == np.array([False, True, True, True]))
+
+    mask = tidy_filter_mask(tidy, lambda series: series["age"] == 1 and series["beauty"] == 1)
+    assert np.all(mask == np.array([False, False, False, True]))
+
     mask = tidy_filter_mask(tidy, {"|age": [0], "&beauty": [1]})
     assert np.all(mask == np.array([False, True, False, False]))
 
@@ -31,10 +48,39 @@ def test_tidy_filter_mask() -> None:
     mask = tidy_filter_mask(tidy, {"|age": [0], "|beauty": [1]})
     assert np.all(mask == np.array([True, True, False, True]))
 
+    mask = tidy_filter_mask(tidy, {"|age": [0], "&beauty": [2]})
+    assert np.all(mask == np.array([False, False, False, False]))
+
     mask = tidy_filter_mask(tidy, {})
     assert np.all(mask == np.array([True, True, True, True]))
 
 
+def test_tidy_filter_mask_square() -> None:
+    tidy = pd.DataFrame(dict(a=[1, -2], b=[3, 4]))
+    mask = tidy_filter_mask(tidy, lambda series: series.to_numpy()[1] > 0)
+    assert np.all(mask == np.array([True, True]))
+
+    mask = tidy_filter_mask(tidy, VectorizedTidyFilter(lambda frame: frame.to_numpy()[1] > 0))
+    assert np.all(mask == np.array([False, True]))
+
+
+def test_tidy_filter_mask_categorical() -> None:
+    tidy = pd.DataFrame(dict(type=pd.Categorical(["T", "B", "T", "NK"]), age=[0, 1, 2, 3]))
+    mask = tidy_filter_mask(tidy, {"|type": ["T", "NK", "other"]})
+    assert np.all(mask == np.array([True, False, True, True]))
+
+    mask = tidy_filter_mask(tidy, {"|type": {"B"}, "&age": [1, 2]})
+    assert np.all(mask == np.array([False, True, False, False]))
+
+
+def test_compile_tidy_filter() -> None:
+    tidy = pd.DataFrame(dict(age=[0, 0, 1, 1], beauty=[0, 1, 0, 1]))
+    compiled = compile_tidy_filter({"|age": [0], "&beauty": [1]})
+    assert np.all(compiled.function(tidy) == np.array([False, True, False, False]))
+    assert np.all(tidy_filter_mask(tidy, compiled) == np.array([False, True, False, False]))
+    assert np.all(tidy_filter_data(tidy.iloc[1:, :], compiled).values == np.array([[0, 1]]))
+
+
 def test_tidy_filter_data() -> None:
     tidy = pd.DataFrame(dict(age=[0, 0, 1, 1], beauty=[0, 1, 0, 1]))
     filtered = tidy_filter_data(tidy, lambda series: series["age"] == series["beauty"])
@@ -51,9 +97,24 @@ def test_tidy_filter_data() -> None:
 
     filtered = tidy_filter_data(tidy, {})
     assert np.all(filtered.values == np.array([[0, 0], [0, 1], [1, 0], [1, 1]]))
+    assert filtered is tidy
+
+    filtered = tidy_filter_data(tidy, {"&age": [2]})
+    assert filtered.shape == (0, 2)
+    assert list(filtered.columns) == ["age", "beauty"]
+
+
+def test_tidy_filter_data_float32() -> None:
+    tidy = pd.DataFrame(dict(fraction=np.array([0.0, 0.5, 1.0], dtype="float32")))
+    filtered = tidy_filter_data(tidy, VectorizedTidyFilter(lambda frame: frame["fraction"] > 0.25))
+    assert filtered["fraction"].dtype == "float32"
+    assert list(filtered["fraction"]) == [0.5, 1.0]
 
 
 def test_matrix_filter_data() -> None:
     matrix = pd.DataFrame([[0, 1, 2], [3, 4, 5], [5, 6, 7]], index=["a", "b", "c"], columns=["x", "y", "z"])
     filtered = matrix_filter_data(matrix, rows_filter=["a", "b"], columns_filter=["x", "z"])
     assert np.all(filtered.values == np.array([[0, 2], [3, 5]]))
+
+    assert matrix_filter_data(matrix) is matrix
+    assert matrix_filter_data(matrix, rows_filter=["a", "b", "c"], columns_filter=["x", "y", "z"]) is matrix
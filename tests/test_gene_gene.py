@@ -0,0 +1,75 @@
+"""
+Test the ``mcbrowse.figures.gene_gene`` module.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd  # type: ignore
+from daf import Frame
+
+from mcbrowse.figures.gene_gene import *  # pylint: disable=wildcard-import,unused-wildcard-import
+from mcbrowse.figures.interface import FigureNeeds
+
+from .memory_reader import MemoryReader
+
+# pylint: disable=missing-function-docstring
+
+
+def _reader() -> MemoryReader:
+    return MemoryReader(
+        axes=dict(metacell=["M1", "M2", "M3"], gene=["FOXP1", "CD8A"]),
+        vectors={"metacell;type": ["T", "B", "T"], "metacell;age": [1, 2, 3]},
+        matrices={"gene,metacell;fraction": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]},
+    )
+
+
+def test_gene_gene_veneer_needs() -> None:
+    veneer = GeneGeneVeneer()
+    assert veneer.needs() == FigureNeeds(values=True, tooltips=True)
+
+    veneer.tooltips = None
+    assert veneer.needs() == FigureNeeds(values=True, tooltips=False)
+
+
+def _collect(gene_gene_filter: GeneGeneFilter, reader: MemoryReader, needs: Optional[FigureNeeds] = None) -> Frame:
+    tidy = gene_gene_filter.collect(reader.as_daf(), needs).tidy  # pylint: disable=no-member
+    assert tidy is not None
+    return tidy
+
+
+def test_gene_gene_collect() -> None:
+    tidy = _collect(
+        GeneGeneFilter(x_gene_name="CD8A", y_gene_name="FOXP1", metacell_tooltip="age"),
+        _reader(),
+        GeneGeneVeneer().needs(),
+    )
+    assert list(tidy.index) == ["M1", "M2", "M3"]
+    assert list(tidy.columns) == ["x_gene_fraction", "y_gene_fraction", "metacell_value", "metacell_tooltip"]
+    assert tidy["x_gene_fraction"].dtype == "float32"
+    assert np.allclose(tidy["x_gene_fraction"], [0.4, 0.5, 0.6])
+    assert np.allclose(tidy["y_gene_fraction"], [0.1, 0.2, 0.3])
+    assert isinstance(tidy["metacell_value"].dtype, pd.CategoricalDtype)
+    assert list(tidy["metacell_value"]) == ["T", "B", "T"]
+    assert list(tidy["metacell_tooltip"]) == ["M1\nage: 1", "M2\nage: 2", "M3\nage: 3"]
+
+
+def test_gene_gene_collect_needs() -> None:
+    reader = _reader()
+    tidy = _collect(
+        GeneGeneFilter(x_gene_name="CD8A", y_gene_name="FOXP1", metacell_tooltip="age"),
+        reader,
+        FigureNeeds(values=False, tooltips=False),
+    )
+    assert list(tidy.columns) == ["x_gene_fraction", "y_gene_fraction"]
+    assert reader.fetched == ["metacell,gene=CD8A;fraction", "metacell,gene=FOXP1;fraction"]
+
+    tidy = _collect(GeneGeneFilter(x_gene_name="CD8A", y_gene_name="FOXP1"), _reader())
+    assert list(tidy.columns) == ["x_gene_fraction", "y_gene_fraction", "metacell_value"]
+
+
+def test_gene_gene_collect_index() -> None:
+    reader = _reader()
+    gene_gene_filter = GeneGeneFilter(x_gene_name="CD8A", y_gene_name="FOXP1")
+    _collect(gene_gene_filter, reader).index.name = "renamed"
+    assert _collect(gene_gene_filter, reader).index.name is None
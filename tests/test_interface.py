@@ -0,0 +1,135 @@
+"""
+Test the ``mcbrowse.figures.interface`` module.
+"""
+
+import numpy as np
+import pandas as pd  # type: ignore
+
+from mcbrowse.common import VectorizedTidyFilter
+from mcbrowse.figures.interface import *  # pylint: disable=wildcard-import,unused-wildcard-import
+
+# pylint: disable=missing-function-docstring
+
+
+def test_tidy_columns() -> None:
+    tidy = TidyColumns(dict(age=[0, 0, 1, 1], beauty=np.array([0, 1, 0, 1])), np.array(["a", "b", "c", "d"]))
+    assert tidy.size == 4
+    assert list(tidy.frame.index) == ["a", "b", "c", "d"]
+    assert np.all(tidy.frame.values == np.array([[0, 0], [0, 1], [1, 0], [1, 1]]))
+
+    taken = tidy.take(np.array([3, 1]))
+    assert list(taken.index) == ["d", "b"]
+    assert np.all(taken.frame.values == np.array([[1, 1], [0, 1]]))
+
+    assert tidy.select(np.array([True, True, True, True])) is tidy
+    assert tidy.select(np.array([False, False, False, False])) is None
+
+
+def test_tidy_columns_frame_does_not_copy() -> None:
+    x_values = np.array([0.0, 0.5, 1.0])
+    y_values = np.array([1.0, 0.5, 0.0])
+    tidy = TidyColumns(dict(x=x_values, y=y_values), pd.Index(["a", "b", "c"]))
+    assert np.shares_memory(tidy.frame["x"].values, x_values)
+    assert np.shares_memory(tidy.frame["y"].values, y_values)
+
+
+def test_tidy_figure_data() -> None:
+    data = TidyFigureData(dict(age=np.array([0, 0, 1, 1]), beauty=np.array([0, 1, 0, 1])))
+    data.filter({"|age": [0], "|beauty": [1]})
+    assert data.tidy is not None
+    assert np.all(data.tidy.values == np.array([[0, 0], [0, 1], [1, 1]]))
+
+    data.highlight({"&beauty": [1]})
+    assert data.highlighted is not None
+    assert np.all(data.tidy.values == np.array([[0, 0]]))
+    assert np.all(data.highlighted.values == np.array([[0, 1], [1, 1]]))
+
+    data.sort([">age"])
+    assert np.all(data.highlighted.values == np.array([[1, 1], [0, 1]]))
+
+    data.randomize(random_seed=123456)
+    assert np.all(data.highlighted.values == np.array([[1, 1], [0, 1]]))
+
+    data.filter({"&age": [1]})
+    assert data.tidy is None
+    assert np.all(data.highlighted.values == np.array([[1, 1]]))
+
+
+def test_tidy_figure_data_frame() -> None:
+    frame = pd.DataFrame(dict(age=[0, 0, 1, 1], beauty=[0, 1, 0, 1]), index=["a", "b", "c", "d"])
+    data = TidyFigureData(frame)
+    assert data.tidy is frame
+    data.highlight(VectorizedTidyFilter(lambda frame: frame["age"] == frame["beauty"]))
+    assert data.highlighted is not None
+    assert list(data.highlighted.index) == ["a", "d"]
+    assert data.tidy is not None
+    assert list(data.tidy.index) == ["b", "c"]
+
+
+def test_figure_needs() -> None:
+    assert FigureNeeds() == FigureNeeds(values=True, tooltips=True)
+    assert FigureNeeds(tooltips=False).values
+    assert not FigureNeeds(tooltips=False).tooltips
+
+
+def test_tidy_figure_data_highlight_all_or_none() -> None:
+    data = TidyFigureData(pd.DataFrame(dict(age=[0, 0, 1, 1], beauty=[0, 1, 0, 1])))
+    data.highlight({"&age": [2]})
+    assert data.highlighted is None
+    assert data.tidy is not None
+    assert data.tidy.shape == (4, 2)
+
+    data.highlight({"&age": [0, 1]})
+    assert data.tidy is None
+    assert data.highlighted is not None
+    assert data.highlighted.shape == (4, 2)
+
+
+def test_tidy_figure_data_modified_frame() -> None:
+    data = TidyFigureData(dict(age=np.array([0, 1, 2])))
+    assert data.tidy is not None
+    data.tidy["beauty"] = np.array([3, 4, 5])
+    data.highlight({"|age": [2]})
+    assert data.tidy is not None
+    assert data.highlighted is not None
+    assert list(data.tidy.columns) == ["age", "beauty"]
+    assert np.all(data.tidy.values == np.array([[0, 3], [1, 4]]))
+    assert np.all(data.highlighted.values == np.array([[2, 5]]))
+
+
+def test_tidy_figure_data_empty() -> None:
+    data = TidyFigureData({})
+    assert data.tidy is not None
+    assert data.tidy.shape == (0, 0)
+
+    data = TidyFigureData(dict(age=np.array([], dtype="int32")))
+    data.filter({"&age": [1]})
+    assert data.tidy is None
+
+
+def test_tidy_figure_data_extension_dtype() -> None:
+    times = pd.date_range("2020", periods=3, tz="US/Eastern")
+    dtype = str(times.dtype)
+    data = TidyFigureData(pd.DataFrame(dict(time=times, age=[0, 1, 2])))
+    data.highlight({"|age": [2]})
+    assert data.tidy is not None
+    assert data.highlighted is not None
+    assert str(data.tidy["time"].dtype) == dtype
+    assert str(data.highlighted["time"].dtype) == dtype
+
+    data.randomize(random_seed=1)
+    assert data.tidy is not None
+    assert str(data.tidy["time"].dtype) == dtype
+    assert sorted(data.tidy["time"]) == list(times[:2])
+
+
+def test_tidy_figure_data_series() -> None:
+    data = TidyFigureData(dict(x=pd.Series([1, 2, 3], index=list("abc"))), index=pd.Index(list("abc")))
+    data.randomize(random_seed=1)
+    assert data.tidy is not None
+    assert sorted(data.tidy["x"]) == [1, 2, 3]
+
+    data = TidyFigureData(dict(x=pd.Series([1, 2, 3])), index=pd.Index(list("abc")))
+    assert data.tidy is not None
+    assert list(data.tidy["x"]) == [1, 2, 3]
+    assert list(data.tidy.index) == ["a", "b", "c"]
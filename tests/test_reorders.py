@@ -15,11 +15,32 @@ def test_sort_by_columns() -> None:
     age_before_beauty = tidy_sort_by(tidy, [">age", "<beauty"])
     assert np.all(age_before_beauty.values == np.array([[1, 0], [1, 1], [0, 0], [0, 1]]))
 
+    named = pd.DataFrame(dict(name=["b", "a", "b", "a"], beauty=[0, 1, 0, 1]))
+    named_by_beauty = tidy_sort_by(named, [">name", ">beauty"])
+    assert np.all(named_by_beauty.values == np.array([["b", 0], ["b", 0], ["a", 1], ["a", 1]], dtype="object"))
+
+    unsigned = pd.DataFrame(dict(size=np.array([0, 2, 1], dtype="uint8"), fraction=[0.5, 0.25, 1.0]))
+    assert np.all(tidy_sort_by(unsigned, [">size"])["size"].values == np.array([2, 1, 0]))
+    assert np.all(tidy_sort_by(unsigned, [">fraction"])["fraction"].values == np.array([1.0, 0.5, 0.25]))
+
     quality = tidy_sort_by(tidy, lambda series: (series["age"] + series["beauty"], series["age"], series["beauty"]))
     assert np.all(quality.values == np.array([[0, 0], [0, 1], [1, 0], [1, 1]]))
 
+    backwards = tidy_sort_by(tidy, VectorizedTidyOrder(lambda frame: -frame["age"] - frame["beauty"]))
+    assert np.all(backwards.values == np.array([[1, 1], [0, 1], [1, 0], [0, 0]]))
+
+
+def test_tidy_sort_by_square() -> None:
+    tidy = pd.DataFrame(dict(a=[1, -2], b=[3, 4]))
+    second = tidy_sort_by(tidy, lambda series: -series.to_numpy()[1])
+    assert np.all(second.values == np.array([[-2, 4], [1, 3]]))
+
 
 def test_randomise() -> None:
     tidy = pd.DataFrame(dict(age=[0, 0, 1, 1], beauty=[0, 1, 0, 1]))
     randomized = tidy_randomize(tidy, random_seed=123456)
-    assert np.all(randomized.values == np.array([[1, 1], [0, 0], [1, 0], [0, 1]]))
+    assert np.all(randomized.values == np.array([[0, 0], [1, 0], [0, 1], [1, 1]]))
+
+
+def test_random_indices() -> None:
+    assert np.all(tidy_random_indices(4, random_seed=123456) == np.array([0, 2, 1, 3]))
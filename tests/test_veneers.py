@@ -2,6 +2,13 @@
 Test the ``mcbrowse.common.veneers`` module.
 """
 
+from dataclasses import FrozenInstanceError
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd  # type: ignore
+import pytest
+
 from mcbrowse.common.veneers import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 # pylint: disable=missing-function-docstring
@@ -9,4 +16,59 @@ from mcbrowse.common.veneers import *  # pylint: disable=wildcard-import,unused-
 
 def test_color_rgb() -> None:
     assert color_rgb("black") == "#000000"
+    assert color_rgb("AliceBlue") == "#f0f8ff"
     assert color_rgb("#010203") == "#010203"
+
+
+def test_color_rgb_vector() -> None:
+    assert np.all(color_rgb_vector(["black", "AliceBlue", "#010203"]) == np.array(["#000000", "#f0f8ff", "#010203"]))
+
+
+def test_frozen_veneer() -> None:
+    veneer = PointsVeneer()
+    assert replace(veneer, fill_color="red").fill_color == "red"
+    assert veneer.fill_color == "black"
+    with pytest.raises(FrozenInstanceError):
+        veneer.fill_color = "red"  # type: ignore
+
+
+def test_resolve_points_veneer() -> None:
+    tidy = pd.DataFrame(dict(size=[1, 2], color=["red", "#010203"]))
+    resolved = resolve_points_veneer(PointsVeneer(fill_diameter="size", fill_color="color", border_width=None), tidy)
+    assert np.all(resolved.fill_diameter == np.array([1.0, 2.0]))
+    assert np.all(resolved.fill_color == np.array(["#ff0000", "#010203"]))
+    assert resolved.border_width is None
+    assert resolved.border_color is not None
+    assert np.all(resolved.border_color == np.array(["#000000", "#000000"]))
+    assert np.all(resolved.transparency == np.array([0.0, 0.0]))
+
+
+def test_resolve_region_veneer() -> None:
+    tidy = pd.DataFrame(dict(width=[1, 2], color=["red", "#010203"]))
+    resolved = resolve_region_veneer(RegionVeneer(fill_color="color", border_width="width", border_color="blue"), tidy)
+    assert np.all(resolved.fill_color == np.array(["#ff0000", "#010203"]))
+    assert resolved.border_width is not None
+    assert resolved.border_width.dtype == "float64"
+    assert np.all(resolved.border_width == np.array([1.0, 2.0]))
+    assert resolved.border_color is not None
+    assert np.all(resolved.border_color == np.array(["#0000ff", "#0000ff"]))
+
+    resolved = resolve_region_veneer(RegionVeneer(border_width=None, border_color=None), tidy)
+    assert np.all(resolved.fill_color == np.array(["#000000", "#000000"]))
+    assert resolved.border_width is None
+    assert resolved.border_color is None
+
+
+def test_resolve_lines_veneer() -> None:
+    tidy = pd.DataFrame(dict(width=[1, 2], color=["red", "#010203"], transparency=[0.25, 0.5]))
+    resolved = resolve_lines_veneer(LinesVeneer(width="width", color="color", transparency="transparency"), tidy)
+    assert resolved.width is not None
+    assert np.all(resolved.width == np.array([1.0, 2.0]))
+    assert resolved.color is not None
+    assert np.all(resolved.color == np.array(["#ff0000", "#010203"]))
+    assert np.all(resolved.transparency == np.array([0.25, 0.5]))
+
+    resolved = resolve_lines_veneer(LinesVeneer(width=None, color=None), tidy)
+    assert resolved.width is None
+    assert resolved.color is None
+    assert np.all(resolved.transparency == np.array([0.0, 0.0]))